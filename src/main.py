@@ -18,6 +18,12 @@ python timesheet_filler.py \
 --month 8 --year 2025 \
 --employee "Mario Regala" --client "Albert Tim Cronin"
 
+Skipping OCR (much faster when the entries are already known)
+--ocr-json "data/sample_entries.json"       # JSON array of {date, start, end, hours, raw}
+--entries "8/4 9:00-15:00 6; 8/5 9-5:30pm 8.5; 8/6 10-12pm 2"
+                                            # MM/DD START-END [HOURS], separated by ';' or ','
+Either one replaces --image; --entries wins over --ocr-json.
+
 Notes
 - Defaults assume shifts start at 9:00 AM when the start time is omitted, as requested.
 - If a handwritten total is missing or disagrees with computed hours, we compute from start/end and flag the discrepancy in console output.
@@ -26,27 +32,19 @@ Notes
 
 import argparse
 import datetime as dt
+import functools
+import io
 import json
-import math
 import os
 import re
+import sys
+import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
-# --- OCR: default to pytesseract (you must have Tesseract installed locally) ---
-try:
-   import pytesseract  # type: ignore
-   from PIL import Image  # type: ignore
-except Exception:  # pragma: no cover
-   pytesseract = None
-   Image = None
-
-# --- PDF overlay libs ---
-from reportlab.pdfgen import canvas as rl_canvas  # type: ignore
-from reportlab.lib.pagesizes import letter  # type: ignore
-from reportlab.pdfbase import pdfmetrics  # type: ignore
-from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
-from PyPDF2 import PdfReader, PdfWriter  # type: ignore
+from typing import List, Optional, Tuple, Union
+
+# OCR (pytesseract + Pillow; you must have Tesseract installed locally) and the
+# PDF libs (reportlab + pypdf) are imported on first use, so --help and the
+# --entries/--ocr-json paths don't pay for loading them.
 
 # ---------------- Configuration ----------------
 
@@ -82,15 +80,50 @@ LAYOUT = {
    "font": {"family": "Helvetica", "size": 10},
 }
 
-WEEKDAYS = ["Mon", "Tue", "Wed", "Thur", "Fri", "Sat", "Sun"]
+# LAYOUT coordinates resolved once at import into flat tuples for the renderer.
+# (The font family stays in LAYOUT since register_fonts may switch it.)
+_ROW_YS = tuple(LAYOUT["table_origin"]["y"] - i * LAYOUT["row_height"] for i in range(7))
+_COL = tuple(LAYOUT["col"][k] for k in ("client", "date", "start", "end", "hours"))
+_HDR_EMP = (LAYOUT["header"]["employee_name"]["x"], LAYOUT["header"]["employee_name"]["y"])
+_HDR_FROM = (LAYOUT["header"]["period_from"]["x"], LAYOUT["header"]["period_from"]["y"])
+_HDR_TO = (LAYOUT["header"]["period_to"]["x"], LAYOUT["header"]["period_to"]["y"])
+_FTR_TOTAL = (LAYOUT["footer"]["total_hours"]["x"], LAYOUT["footer"]["total_hours"]["y"])
+_FTR_SIG_DATE = (LAYOUT["footer"]["signature_date"]["x"], LAYOUT["footer"]["signature_date"]["y"])
+
+# OCR tuning: photos are downscaled so the longest side is at most this many
+# pixels, and Tesseract treats the page as one uniform block of text.
+OCR_MAX_SIDE = 2000
+OCR_CONFIG = "--psm 6 --oem 1"
+# Photos per Tesseract run when OCRing several at once; larger lists can
+# deadlock pytesseract's output pipe.
+OCR_BATCH_SIZE = 50
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thur", "Fri", "Sat", "Sun")
 
-DATE_RE = re.compile(r"(?P<m>\d{1,2})[\/-](?P<d>\d{1,2})(?:[\/-](?P<y>\d{2,4}))?")
 TIME_RE = re.compile(
    r"(?P<h>\d{1,2})(?::(?P<min>\d{2}))?\s*(?P<ampm>a\.?m\.?|p\.?m\.?)?",
    re.IGNORECASE,
 )
+# Tokenizer for handwritten lines: dates, times, bare numbers and separators.
+_TOKEN_RE = re.compile(
+   # (?![\d:]) keeps a range like '10-12pm' or '9-5:30pm' from backtracking
+   # into a shorter 'date' that the am/pm lookahead would then accept.
+   r"(?P<date>\d{1,2}[\/-]\d{1,2}(?![\d:])(?:[\/-]\d{2,4}(?!\d))?(?!\s*[ap]\.?m))"
+   r"|(?P<time>\d{1,2}(?::\d{2})?\s*[ap]\.?m?\.?|\d{1,2}:\d{2})"
+   r"|(?P<num>\d+(?:\.\d+)?)"
+   r"|(?P<sep>[-–—]|to)",
+   re.I,
+)
+_DATE_SEP_RE = re.compile(r"[\/-]")
+# Optional month: '8/4' and '8/4/2025' carry one, a bare '4' uses --month.
+_DATE_OR_DAY_RE = re.compile(r"(?:(?P<m>\d{1,2})[\/-])?(?P<d>\d{1,2})(?:[\/-](?P<y>\d{2,4}))?")
+_ENTRY_SEP_RE = re.compile(r"[;,]")
+_AMPM_RE = re.compile(r"[ap]m", re.I)
 
-@dataclass
+# slots= needs Python 3.10+; older interpreters still get immutable entries.
+_ENTRY_DATACLASS_OPTS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+@dataclass(**_ENTRY_DATACLASS_OPTS)
 class DayEntry:
    date: dt.date
    start: dt.time
@@ -98,6 +131,17 @@ class DayEntry:
    hours: float
    raw: str
 
+   @classmethod
+   def from_json(cls, row: dict) -> "DayEntry":
+      """Build an entry from an already-normalized --ocr-json row (no parsing/inference)."""
+      return cls(
+         date=dt.date.fromisoformat(row["date"]),
+         start=dt.time.fromisoformat(row["start"]),
+         end=dt.time.fromisoformat(row["end"]),
+         hours=float(row["hours"]),
+         raw=row.get("raw", ""),
+      )
+
 # ---------------- Utilities ----------------
 
 def parse_time(text: str, default_ampm: Optional[str] = None) -> Optional[dt.time]:
@@ -126,8 +170,8 @@ def infer_times(start_txt: str, end_txt: str, assume_start_9am: bool = True) ->
    end = parse_time(end_txt)
 
    # If one side carries am/pm and the other not, try to infer a day shift.
-   end_has_ampm = bool(re.search(r"[ap]m", end_txt, re.I))
-   start_has_ampm = bool(re.search(r"[ap]m", start_txt, re.I))
+   end_has_ampm = bool(_AMPM_RE.search(end_txt))
+   start_has_ampm = bool(_AMPM_RE.search(start_txt))
 
    if assume_start_9am and start is None:
       start = dt.time(9, 0)
@@ -140,7 +184,7 @@ def infer_times(start_txt: str, end_txt: str, assume_start_9am: bool = True) ->
       # Handle cases where times roll past midnight (unlikely here). If end <= start, assume same-day pm shift.
       if (end.hour, end.minute) <= (start.hour, start.minute):
          # bump end by +12h if that makes sense (rare for this use case).
-         end = (dt.datetime.combine(dt.date.today(), end) + dt.timedelta(hours=12)).time()
+         end = dt.time((end.hour + 12) % 24, end.minute)
       return start, end
 
    # Fallbacks
@@ -153,25 +197,65 @@ def infer_times(start_txt: str, end_txt: str, assume_start_9am: bool = True) ->
 
 
 def hours_between(start: dt.time, end: dt.time) -> float:
-   s = dt.datetime.combine(dt.date.today(), start)
-   e = dt.datetime.combine(dt.date.today(), end)
+   # Minutes since midnight; an end at or before the start rolls to the next day.
+   s = start.hour * 60 + start.minute
+   e = end.hour * 60 + end.minute
    if e <= s:
-      e += dt.timedelta(days=1)
-   delta = e - s
-   return round(delta.total_seconds() / 3600.0, 2)
+      e += 24 * 60
+   return round((e - s) / 60.0, 2)
 
 
 # ---------------- OCR & Parsing ----------------
 
-def ocr_image_to_text(image_path: str) -> str:
-   if pytesseract is None or Image is None:
+def _prepare_for_ocr(image_path: str):
+   from PIL import Image, ImageOps  # type: ignore
+
+   img = Image.open(image_path)
+   # Simple pre-processing for hand-written notes: honor phone rotation,
+   # grayscale, shrink oversized photos and stretch contrast.
+   img = ImageOps.exif_transpose(img)
+   img = img.convert("L")  # grayscale
+   w, h = img.size
+   longest = max(w, h)
+   if longest > OCR_MAX_SIDE:
+      scale = OCR_MAX_SIDE / longest
+      img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+   return ImageOps.autocontrast(img)
+
+
+def ocr_image_to_text(image_path: Union[str, List[str]]) -> Union[str, List[str]]:
+   """OCR one photo (returns its text) or several (returns one text per photo).
+      Several photos go through a single Tesseract run per OCR_BATCH_SIZE chunk
+      using Tesseract's image-list input, so startup is paid once per chunk.
+   """
+   try:
+      import pytesseract  # type: ignore
+      import PIL  # type: ignore  # noqa: F401
+   except ImportError:
       raise RuntimeError(
          "pytesseract/Pillow not available. Install them or replace ocr_image_to_text with a cloud OCR call."
       )
-   img = Image.open(image_path)
-   # Optional: simple pre-processing for hand-written notes
-   img = img.convert("L")  # grayscale
-   return pytesseract.image_to_string(img)
+   if isinstance(image_path, str):
+      return pytesseract.image_to_string(_prepare_for_ocr(image_path), config=OCR_CONFIG)
+
+   texts: List[str] = []
+   for i in range(0, len(image_path), OCR_BATCH_SIZE):
+      chunk = image_path[i:i + OCR_BATCH_SIZE]
+      with tempfile.TemporaryDirectory() as tmp:
+         prepared = []
+         for j, path in enumerate(chunk):
+            out = os.path.join(tmp, f"{j}.png")
+            _prepare_for_ocr(path).save(out)
+            prepared.append(out)
+         list_path = os.path.join(tmp, "images.txt")
+         with open(list_path, "w") as f:
+            f.write("\n".join(prepared) + "\n")
+         output = pytesseract.image_to_string(list_path, config=OCR_CONFIG)
+      # Tesseract ends every page with a form feed.
+      pages = output.split("\f")
+      pages += [""] * (len(chunk) - len(pages))
+      texts.extend(pages[:len(chunk)])
+   return texts
 
 
 def parse_handwritten_lines(text: str, month: int, year: int) -> List[DayEntry]:
@@ -183,35 +267,52 @@ def parse_handwritten_lines(text: str, month: int, year: int) -> List[DayEntry]:
       line = raw.strip()
       if not line:
          continue
-      # Extract date
-      date_match = DATE_RE.search(line)
-      if date_match:
-         m = int(date_match.group("m"))
-         d = int(date_match.group("d"))
-         y = int(date_match.group("y") or year)
-      else:
-         # Look for a leading day number like '4 -'
-         m2 = re.match(r"^(?P<d>\d{1,2})\b", line)
-         if not m2:
-               continue
-         d = int(m2.group("d"))
-         m = month
-         y = year
-      # Split into time segments: '9 to 3pm' or '9-3pm'
-      parts = re.split(r"[-–—]|to", line, flags=re.I)
-      if len(parts) < 2:
+      # Single pass over the line: the first token is the date (or a bare
+      # day number), the next two values are start/end and a third number
+      # is the handwritten hours total.
+      date_match: Optional[re.Match] = None
+      values: List[Tuple[str, str]] = []
+      seen_sep = False
+      for tok in _TOKEN_RE.finditer(line):
+         kind = tok.lastgroup
+         tok_txt = tok.group()
+         if date_match is None:
+            # '8/4', '8/4/2025' or a bare day like '4'
+            date_match = _DATE_OR_DAY_RE.fullmatch(tok_txt)
+            if date_match is None:
+               break
+         elif kind == "sep":
+            seen_sep = True
+         elif kind == "date":
+            # A later 'a-b' is a time range like '9-5', not a date.
+            seen_sep = True
+            values.extend(("num", v) for v in _DATE_SEP_RE.split(tok_txt))
+         else:
+            values.append((kind, tok_txt))
+      if date_match is None or not seen_sep:
          continue
-      start_txt = parts[1] if len(parts) >= 2 else "9"
-      end_txt = parts[2] if len(parts) >= 3 else "5pm"
+
+      m_txt, d_txt, y_txt = date_match.group("m", "d", "y")
+      m = int(m_txt) if m_txt else month
+      d = int(d_txt)
+      y = int(y_txt) if y_txt else year
+
+      start_txt = values[0][1] if values else ""
+      end_txt = values[1][1] if len(values) >= 2 else "5pm"
+      # Handwritten total: the last number after start/end
+      extras = values[2:]
+      hours_nums = [v for v in extras if v[0] == "num"]
+      hours_tok = hours_nums[-1] if hours_nums else None
+      if extras and hours_tok is None:
+         print(f"[WARN] {raw.strip()!r}: no numeric hours total after start/end; using computed.")
 
       start_t, end_t = infer_times(start_txt, end_txt, assume_start_9am=True)
       computed_hours = hours_between(start_t, end_t)
 
-      # Try to read a trailing explicit hours number
-      hours_match = re.search(r"(\d+(?:\.\d+)?)\s*$", line)
+      # Use the trailing explicit hours number, if any
       final_hours = computed_hours
-      if hours_match:
-         handwritten_hours = float(hours_match.group(1))
+      if hours_tok is not None:
+         handwritten_hours = float(hours_tok[1])
          if abs(handwritten_hours - computed_hours) > 0.25:
                print(
                   f"[WARN] {m}/{d}/{y}: handwritten {handwritten_hours}h vs computed {computed_hours}h; using computed."
@@ -231,6 +332,23 @@ def parse_handwritten_lines(text: str, month: int, year: int) -> List[DayEntry]:
    return entries
 
 
+def parse_entries_dsl(s: str, month: int, year: int) -> List[DayEntry]:
+   """Parse compact typed entries like '8/4 9:00-15:00 6; 8/5 9-5:30pm 8.5; 8/6 10-12pm 2'.
+      Each entry is one handwritten-style line, so the same rules apply.
+      Typed input has no OCR noise, so any segment that yields no entry is reported.
+   """
+   entries: List[DayEntry] = []
+   for seg in _ENTRY_SEP_RE.split(s):
+      seg = seg.strip()
+      if not seg:
+         continue
+      parsed = parse_handwritten_lines(seg, month, year)
+      if not parsed:
+         print(f"[WARN] --entries: could not parse '{seg}'; expected MM/DD START-END [HOURS].")
+      entries.extend(parsed)
+   return entries
+
+
 # ---------------- Week mapping ----------------
 
 def week_bounds_from_dates(dates: List[dt.date]) -> Tuple[dt.date, dt.date]:
@@ -244,18 +362,41 @@ def week_bounds_from_dates(dates: List[dt.date]) -> Tuple[dt.date, dt.date]:
    return start, start + dt.timedelta(days=6)
 
 
-def map_entries_to_week(entries: List[DayEntry], week_start: dt.date) -> Dict[str, Optional[DayEntry]]:
-   mapping: Dict[str, Optional[DayEntry]] = {w: None for w in WEEKDAYS}
+def map_entries_to_week(entries: List[DayEntry], week_start: dt.date) -> List[Optional[DayEntry]]:
+   """Return seven slots, Monday first; index i lines up with WEEKDAYS[i]."""
+   mapping: List[Optional[DayEntry]] = [None] * 7
    for e in entries:
       idx = (e.date - week_start).days
       if 0 <= idx <= 6:
-         mapping[WEEKDAYS[idx]] = e
+         mapping[idx] = e
    return mapping
 
 
 # ---------------- PDF writing ----------------
 
+_FONTS_REGISTERED = False
+
+
+@functools.lru_cache(maxsize=512)
+def _fmt_date(d: dt.date) -> str:
+   return d.strftime("%m/%d/%Y")
+
+
+def _fmt_time(t: dt.time) -> str:
+   # Same as strftime("%-I:%M %p"), which is GNU-only and fails on Windows.
+   h = t.hour % 12 or 12
+   return f"{h}:{t.minute:02d} {'AM' if t.hour < 12 else 'PM'}"
+
+
 def register_fonts():
+   # Only attempt registration once per process; a missing TTF keeps Helvetica.
+   global _FONTS_REGISTERED
+   if _FONTS_REGISTERED:
+      return
+   _FONTS_REGISTERED = True
+   from reportlab.pdfbase import pdfmetrics  # type: ignore
+   from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
+
    try:
       pdfmetrics.registerFont(TTFont("Inter", "Inter-Regular.ttf"))
       LAYOUT["font"]["family"] = "Inter"
@@ -263,97 +404,89 @@ def register_fonts():
       pass  # fallback to Helvetica
 
 
-def draw_text(c: rl_canvas.Canvas, x: float, y: float, text: str, size: int = 10):
-   c.setFont(LAYOUT["font"]["family"], size)
-   c.drawString(x, y, text)
-
-
 def render_to_pdf(template_pdf: str,
                out_pdf: str,
                employee: str,
                client: str,
-               mapping: Dict[str, Optional[DayEntry]],
+               mapping: List[Optional[DayEntry]],
                period_from: dt.date,
                period_to: dt.date,
                total_hours: float,
                debug_grid: bool = False,
                signature_date: Optional[dt.date] = None) -> None:
-   reader = PdfReader(template_pdf)
-   page = reader.pages[0]
+   from reportlab.pdfgen import canvas as rl_canvas  # type: ignore
+   from pypdf import PdfReader, PdfWriter  # type: ignore
+
+   # Clone the template once; the overlay is stamped onto its first page,
+   # which is the only page written out.
+   writer = PdfWriter(clone_from=template_pdf)
+   for extra in list(writer.pages)[1:]:
+      writer.remove_page(extra)
+   page = writer.pages[0]
    width = float(page.mediabox.width)
    height = float(page.mediabox.height)
 
-   # Overlay canvas
-   overlay_path = out_pdf + ".overlay.pdf"
-   c = rl_canvas.Canvas(overlay_path, pagesize=(width, height))
+   # Overlay canvas, kept in memory and merged straight from the buffer
+   buf = io.BytesIO()
+   c = rl_canvas.Canvas(buf, pagesize=(width, height))
    register_fonts()
+   family = LAYOUT["font"]["family"]
+   # Bound once; these run for every cell.
+   draw = c.drawString
+   set_font = c.setFont
 
    # Debug grid for alignment
    if debug_grid:
+      # One path for the whole grid instead of a line() per gridline.
       c.setStrokeGray(0.8)
-      for x in range(0, int(width), 25):
-         c.line(x, 0, x, height)
-      for y in range(0, int(height), 25):
-         c.line(0, y, width, y)
-
-   # Header fields
-   draw_text(c, LAYOUT["header"]["employee_name"]["x"], LAYOUT["header"]["employee_name"]["y"], employee, 11)
-   draw_text(c, LAYOUT["header"]["period_from"]["x"], LAYOUT["header"]["period_from"]["y"], period_from.strftime("%m/%d/%Y"))
-   draw_text(c, LAYOUT["header"]["period_to"]["x"], LAYOUT["header"]["period_to"]["y"], period_to.strftime("%m/%d/%Y"))
-
-   origin_x = LAYOUT["table_origin"]["x"]
-   origin_y = LAYOUT["table_origin"]["y"]
-   row_h = LAYOUT["row_height"]
-
-   for i, wd in enumerate(WEEKDAYS):
-      y = origin_y - i * row_h
+      c.grid(list(range(0, int(width) + 1, 25)), list(range(0, int(height) + 1, 25)))
+
+   # Header fields (employee name is one point larger than everything else)
+   set_font(family, 11)
+   draw(_HDR_EMP[0], _HDR_EMP[1], employee)
+   set_font(family, LAYOUT["font"]["size"])
+   draw(_HDR_FROM[0], _HDR_FROM[1], _fmt_date(period_from))
+   draw(_HDR_TO[0], _HDR_TO[1], _fmt_date(period_to))
+
+   col_client, col_date, col_start, col_end, col_hours = _COL
+   dates = [period_from + dt.timedelta(days=i) for i in range(7)]
+   date_strs = [_fmt_date(d) for d in dates]
+
+   for i, e in enumerate(mapping):
+      y = _ROW_YS[i]
       # Client
-      draw_text(c, LAYOUT["col"]["client"], y, client)
+      draw(col_client, y, client)
       # Skip day label since it's already in the template
       # Date
-      the_date = period_from + dt.timedelta(days=i)
-      draw_text(c, LAYOUT["col"]["date"], y, the_date.strftime("%m/%d/%Y"))
+      draw(col_date, y, date_strs[i])
 
-      e = mapping.get(wd)
       if e:
-         draw_text(c, LAYOUT["col"]["start"], y, e.start.strftime("%-I:%M %p") if hasattr(e.start, 'strftime') else "")
-         draw_text(c, LAYOUT["col"]["end"], y, e.end.strftime("%-I:%M %p") if hasattr(e.end, 'strftime') else "")
+         draw(col_start, y, _fmt_time(e.start))
+         draw(col_end, y, _fmt_time(e.end))
          # Hours typically shown as integer; but keep .2f if needed
-         hrs_txt = f"{e.hours:g}" if math.isclose(e.hours, round(e.hours)) else f"{e.hours:.2f}"
-         draw_text(c, LAYOUT["col"]["hours"], y, hrs_txt)
+         hrs_txt = f"{e.hours:g}" if abs(e.hours - round(e.hours)) < 1e-9 else f"{e.hours:.2f}"
+         draw(col_hours, y, hrs_txt)
 
    # Footer totals & signature placeholders
-   draw_text(c, LAYOUT["footer"]["total_hours"]["x"], LAYOUT["footer"]["total_hours"]["y"], f"{total_hours:g}")
-   #draw_text(c, LAYOUT["footer"]["signature_name"]["x"], LAYOUT["footer"]["signature_name"]["y"], employee)
+   draw(_FTR_TOTAL[0], _FTR_TOTAL[1], f"{total_hours:g}")
+   #draw(LAYOUT["footer"]["signature_name"]["x"], LAYOUT["footer"]["signature_name"]["y"], employee)
    # Use provided signature_date if given; otherwise default to the week end (period_to)
    sig_date = signature_date or period_to
-   draw_text(c,
-             LAYOUT["footer"]["signature_date"]["x"],
-             LAYOUT["footer"]["signature_date"]["y"],
-             sig_date.strftime("%m/%d/%Y"))
+   draw(_FTR_SIG_DATE[0], _FTR_SIG_DATE[1], _fmt_date(sig_date))
 
    c.save()
 
    # Merge overlay onto template
-   overlay_reader = PdfReader(overlay_path)
-   writer = PdfWriter()
-   base_page = reader.pages[0]
-   base_page.merge_page(overlay_reader.pages[0])
-   writer.add_page(base_page)
-
-   with open(out_pdf, "wb") as f:
-      writer.write(f)
-   try:
-      os.remove(overlay_path)
-   except OSError:
-      pass
+   buf.seek(0)
+   page.merge_page(PdfReader(buf).pages[0], over=True)
+   writer.write(out_pdf)
 
 
 # ---------------- Main ----------------
 
 def main():
    p = argparse.ArgumentParser(description="Fill agency timesheet PDF from handwritten photo")
-   p.add_argument("--image", required=True, help="Path to handwritten photo")
+   p.add_argument("--image", nargs="+", help="Path to handwritten photo (several photos of one week are OCRed together)")
    p.add_argument("--template", required=True, help="Path to template PDF (the agency form)")
    p.add_argument("--out", required=True, help="Output PDF path")
    p.add_argument("--month", type=int, required=True, help="Numeric month for most entries (e.g., 8 for August)")
@@ -361,30 +494,29 @@ def main():
    p.add_argument("--employee", default="Mario Regala")
    p.add_argument("--client", default="Albert Tim Cronin")
    p.add_argument("--ocr-json", help="Optional path to a pre-extracted JSON array of entries to skip OCR")
+   p.add_argument("--entries", help="Typed entries to skip OCR, e.g. \"8/4 9:00-15:00 6; 8/5 9-5:30pm 8.5; 8/6 10-12pm 2\"")
    p.add_argument("--debug-grid", action="store_true", help="Draw a grid to help align coordinates")
    p.add_argument("--signature-date", dest="signature_date", help="Override signature date (YYYY-MM-DD). Defaults to end of week.")
 
    args = p.parse_args()
 
-   if args.ocr_json and os.path.exists(args.ocr_json):
+   if args.entries:
+      entries = parse_entries_dsl(args.entries, args.month, args.year)
+   elif args.ocr_json and os.path.exists(args.ocr_json):
       with open(args.ocr_json) as f:
          data = json.load(f)
-      entries = [
-         DayEntry(
-               date=dt.date.fromisoformat(row["date"]),
-               start=dt.time.fromisoformat(row["start"]),
-               end=dt.time.fromisoformat(row["end"]),
-               hours=float(row["hours"]),
-               raw=row.get("raw", ""),
-         )
-         for row in data
-      ]
+      entries = [DayEntry.from_json(row) for row in data]
    else:
-      text = ocr_image_to_text(args.image)
+      if not args.image:
+         p.error("one of --image, --ocr-json or --entries is required")
+      if len(args.image) == 1:
+         text = ocr_image_to_text(args.image[0])
+      else:
+         text = "\n".join(ocr_image_to_text(args.image))
       entries = parse_handwritten_lines(text, args.month, args.year)
 
    if not entries:
-      raise SystemExit("No entries parsed. Try --ocr-json or adjust your photo/OCR.")
+      raise SystemExit("No entries parsed. Try --ocr-json/--entries or adjust your photo/OCR.")
 
    # Determine the week bounds (Mon–Sun) and map rows
    dates = [e.date for e in entries]